@@ -4,121 +4,415 @@ Currency Converter Tool
 
 This program allows users to convert between currencies using the Fixer API (Apilayer).
 It provides the following features:
-- Fetches live currency symbols from the API.
-- Lets the user search currencies by code or name (or display all).
-- Ensures user selects valid currency codes from displayed results.
+- Fetches live currency symbols from the API (cached locally between runs).
+- Lets the user search currencies by code or name, with one or more keywords (or display all).
+- Ensures user selects valid currency codes from displayed results (with Tab completion where readline is available).
 - Handles input validation for currency codes and amounts.
 - Performs live currency conversion using the API.
 - Includes error handling for network/API issues.
 
 Requirements:
 - requests library
+- orjson library (optional, faster JSON parsing)
 - A valid API key from https://apilayer.com
 
 """
 
+import atexit
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    import readline  # not available on Windows
+except ImportError:
+    readline = None
+else:
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    # Complete nothing by default (not file names); choose_currency_from installs
+    # a currency-code completer for its own prompt and then restores this one.
+    readline.set_completer(lambda text, state: None)
+
+try:
+    import orjson
+    json_loads = orjson.loads  # C parser, used when available
+except ImportError:
+    json_loads = json.loads
 
 API_KEY = "Put_Your_Api_Key_Here"
 BASE_URL = "https://api.apilayer.com/fixer"
+CONVERT_URL = f"{BASE_URL}/convert"
+REQUEST_TIMEOUT = (3.05, 10)  # seconds: (connect, read)
+TIMEOUT_MESSAGE = "❌ Timeout contacting Fixer, please retry."
+
+# One shared session for all API calls: keep-alive and connection pooling
+# avoid a new TCP+TLS handshake on every request.
+SESSION = requests.Session()
+SESSION.headers.update({"apikey": API_KEY})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+atexit.register(SESSION.close)
+
+# The symbols list rarely changes, so it is cached on disk between runs.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "currency_converter")
+SYMBOLS_FILE = os.path.join(CACHE_DIR, "symbols.json")
+ETAG_FILE = os.path.join(CACHE_DIR, "symbols.etag")
+SYMBOLS_TTL = 6 * 60 * 60  # seconds
+
+# In-memory copy of the symbols, so later main() iterations skip the disk cache too.
+_SYMBOLS_CACHE = {"symbols": {}, "expires": 0.0}
+
+# Background workers used to overlap network round-trips with user think-time.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Set once any request has gone out: from then on the pooled connection is (or is
+# being) opened, so no prewarm request is needed.
+_CONNECTION = {"used": False}
+
+# id(dict) -> (dict, frozenset of its codes). The dict itself is kept in the entry
+# so its id cannot be reused by another object while cached.
+_ALLOWED_CACHE = {}
+_ALLOWED_CACHE_MAX = 16
+
+# (from, to) -> (rate, fetched_at). Repeated conversions between the same pair
+# within RATE_TTL reuse the rate instead of calling the API again.
+_RATE_CACHE = {}
+RATE_TTL = 5 * 60  # seconds
+# The API rounds "result" to 6 decimals, so the rate is requested for a large amount
+# and divided back down to keep its precision for weak-currency pairs (e.g. IDR -> USD).
+RATE_AMOUNT = 1_000_000
+
+# Messages for the API status codes that have a specific meaning.
+ERROR_MESSAGES = {
+    401: "❌ Unauthorized: Check your API key.",
+    403: "❌ Forbidden: You don't have access to this service.",
+    404: "❌ Not Found: The requested resource does not exist.",
+    429: "❌ Too Many Requests: You exceeded the API request limit.",
+}
 
 #======================================================================================================#
 #===================================== Helper Functions =================================================#
 #======================================================================================================#
-def handle_error(response):
+def handle_error(response, report=print):
     """
     Handle API error responses with detailed messages.
 
     Args:
         response (requests.Response): The HTTP response object from the API.
+        report (callable): Used instead of print() to output the messages.
     """
     code = response.status_code
-    if code == 401:
-        print("❌ Unauthorized: Check your API key.")
-    elif code == 403:
-        print("❌ Forbidden: You don't have access to this service.")
-    elif code == 404:
-        print("❌ Not Found: The requested resource does not exist.")
-    elif code == 429:
-        print("❌ Too Many Requests: You exceeded the API request limit.")
+    msg = ERROR_MESSAGES.get(code)
+    if msg:
+        report(msg)
     elif code >= 500:
-        print("❌ Server Error: Try again later.")
+        report("❌ Server Error: Try again later.")
     else:
-        print("❌ Unexpected Error:", code)
-        print("Response:", response.text)
+        report("❌ Unexpected Error:", code)
+        report("Response:", response.text)
+
+#======================================================================================================#
+def api_error(data, report=print):
+    """
+    Print the error reported in an unsuccessful API response body.
+
+    Args:
+        data (dict): The decoded JSON body whose "success" field is false.
+        report (callable): Used instead of print() to output the message.
+    """
+    report("❌ API Error:", data.get("error") or data)
+
+#======================================================================================================#
+def print_symbols(symbols, title, width=40):
+    """
+    Print a titled currency listing with a single write instead of one print per row.
+
+    Args:
+        symbols (dict): Dictionary of currency codes and names to list.
+        title (str): Heading printed above the separator line.
+        width (int): Length of the separator line.
+    """
+    rows = "\n".join(f"{code} : {name}" for code, name in symbols.items())
+    sys.stdout.write(f"\n{title}\n{'-' * width}\n{rows}\n")
+
+#======================================================================================================#
+def load_cached_symbols():
+    """
+    Load the symbols cached on disk by a previous run.
+
+    Returns:
+        tuple: (symbols, etag, age) where symbols is the cached dict (or {}),
+               etag is the stored ETag (or None) and age is the cache age in seconds.
+    """
+    try:
+        with open(SYMBOLS_FILE, encoding="utf-8") as f:
+            symbols = json.load(f)
+        age = time.time() - os.path.getmtime(SYMBOLS_FILE)
+    except (OSError, ValueError):
+        return {}, None, None
+
+    try:
+        with open(ETAG_FILE, encoding="utf-8") as f:
+            etag = f.read().strip() or None
+    except OSError:
+        etag = None
+    return symbols, etag, age
+
+#======================================================================================================#
+def save_cached_symbols(symbols, etag, report=print):
+    """
+    Persist the symbols (and their ETag, if any) to the on-disk cache.
+
+    Args:
+        symbols (dict): Dictionary of currency codes and names.
+        etag (str | None): ETag header returned by the API.
+        report (callable): Used instead of print() to output warnings.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(SYMBOLS_FILE, "w", encoding="utf-8") as f:
+            json.dump(symbols, f)
+        if etag:
+            with open(ETAG_FILE, "w", encoding="utf-8") as f:
+                f.write(etag)
+        elif os.path.exists(ETAG_FILE):
+            os.remove(ETAG_FILE)
+    except OSError as e:
+        report("⚠️ Could not write symbols cache:", e)
+
+#======================================================================================================#
+def remember_symbols(symbols, ttl=SYMBOLS_TTL):
+    """
+    Keep freshly validated symbols in memory for the rest of the session.
+
+    Args:
+        symbols (dict): Dictionary of currency codes and names.
+        ttl (float): Seconds the symbols stay valid.
+
+    Returns:
+        dict: The same symbols, for convenient returning.
+    """
+    _SYMBOLS_CACHE["symbols"] = symbols
+    _SYMBOLS_CACHE["expires"] = time.monotonic() + ttl
+    return symbols
 
 #======================================================================================================#
-def get_symbols():
+def get_symbols(report=print):
     """
     Fetch available currency symbols from the API.
 
+    The result is cached in memory and on disk for SYMBOLS_TTL seconds. Once the cache is
+    stale it is revalidated with the stored ETag (a 304 reply reuses it), and
+    it is used as a fallback if the API cannot be reached or returns an HTTP error.
+
+    Args:
+        report (callable): Used instead of print() to output messages.
+
     Returns:
         dict: A dictionary where keys are currency codes (e.g., "USD")
               and values are currency names (e.g., "United States Dollar").
-              Returns {} if request fails.
+              Returns {} if request fails and nothing is cached.
     """
+    if _SYMBOLS_CACHE["symbols"] and time.monotonic() < _SYMBOLS_CACHE["expires"]:
+        return _SYMBOLS_CACHE["symbols"]
+
+    cached, etag, age = load_cached_symbols()
+    if cached and age < SYMBOLS_TTL:
+        return remember_symbols(cached, SYMBOLS_TTL - age)
+
     url = f"{BASE_URL}/symbols"
-    headers = {"apikey": API_KEY}
+    headers = {"If-None-Match": etag} if cached and etag else {}
+    _CONNECTION["used"] = True
     try:
-        response = requests.get(url, headers=headers)
-    except requests.exceptions.RequestException as e:
-        print("❌ Network error while fetching symbols:", e)
-        return {}
+        response = SESSION.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+        # Read the decoded body straight from the socket: a single bytes copy for the
+        # parser (this also returns the connection to the pool, even for an empty 304).
+        body = response.raw.read(decode_content=True) if response.status_code in (200, 304) else None
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+        if isinstance(e, (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError)):
+            report(TIMEOUT_MESSAGE)
+        else:
+            report("❌ Network error while fetching symbols:", e)
+        if cached:
+            report("Using cached currency list (stale).")
+        return cached
+
+    if response.status_code == 304:
+        try:
+            os.utime(SYMBOLS_FILE)  # still valid: restart the TTL
+        except OSError:
+            pass
+        return remember_symbols(cached)
 
     if response.status_code != 200:
-        handle_error(response)
+        handle_error(response, report)
+        response.close()  # streamed body was not read: release the connection
+        if cached:
+            report("Using cached currency list (stale).")
+        return cached
+
+    data = json_loads(body)
+    if not data.get("success"):
+        api_error(data, report)
         return {}
 
-    data = response.json()
-    # Some APIs might omit the "success" field, so we check safely
-    if not data.get("success", True):
-        print("❌ API Error:", data.get("error", data))
-        return {}
+    symbols = data.get("symbols", {})
+    if symbols:
+        save_cached_symbols(symbols, response.headers.get("ETag"), report)
+        remember_symbols(symbols)
+    return symbols
+
+#======================================================================================================#
+def load_symbols(report=print):
+    """
+    Get the symbols and, if that needed no request (cache hit), prewarm the
+    API connection in the background for the later conversion.
+
+    Args:
+        report (callable): Used instead of print() to output messages.
+
+    Returns:
+        dict: The currency symbols, as returned by get_symbols().
+    """
+    symbols = get_symbols(report)
+    if not _CONNECTION["used"]:
+        _EXECUTOR.submit(prewarm_connection)
+    return symbols
+
+#======================================================================================================#
+def run_in_background(func, *args):
+    """
+    Run func(*args, report=...) on the worker pool, holding back its messages
+    so they are not printed into the middle of a prompt.
+
+    Args:
+        func (callable): Function accepting a `report` keyword used instead of print().
+        *args: Positional arguments for func.
 
-    return data.get("symbols", {})
+    Returns:
+        concurrent.futures.Future: Resolves to (result, messages); see background_result().
+    """
+    def call():
+        messages = []
+        result = func(*args, report=lambda *parts: messages.append(parts))
+        return result, messages
+
+    return _EXECUTOR.submit(call)
 
 #======================================================================================================#
-def search_symbols(symbols):
+def background_result(future):
     """
-    Let the user search currencies or view all.
+    Wait for a run_in_background() call, print its held-back messages and return its result.
 
     Args:
-        symbols (dict): Dictionary of all currency codes and names.
+        future (concurrent.futures.Future): The future returned by run_in_background().
 
     Returns:
-        dict: A filtered dictionary of matches or the full symbols dict.
+        The return value of the background function.
+    """
+    result, messages = future.result()
+    for parts in messages:
+        print(*parts)
+    return result
+
+#======================================================================================================#
+def prewarm_connection():
+    """
+    Open the pooled connection to the API ahead of time so the TLS handshake
+    is already done when the first real request is sent. Runs at most once,
+    and not at all if a request was already made. Errors are ignored.
+    """
+    if _CONNECTION["used"]:
+        return
+    _CONNECTION["used"] = True
+    try:
+        SESSION.head(f"{BASE_URL}/symbols", timeout=REQUEST_TIMEOUT)
+    except requests.exceptions.RequestException:
+        pass
+
+#======================================================================================================#
+def ask_search_or_all():
+    """
+    Ask the user whether to search currencies or view all of them.
+
+    Returns:
+        str: Either "search" or "all".
     """
     while True:
         choice = input("Do you want to search for a currency or view all? (search/all): ").strip().lower()
         if choice in ("search", "all"):
-            break
+            return choice
         print("❌ Invalid choice. Please type 'search' or 'all'.")
 
-    if choice == "search":
-        keyword = input("Enter part of currency name/code to search: ").strip().lower()
-        matches = {c: n for c, n in symbols.items() if keyword in c.lower() or keyword in n.lower()}
-        if matches:
-            print("\n🔎 Matching Currencies:\n" + "-" * 40)
-            for code, name in matches.items():
-                print(f"{code} : {name}")
-            return matches
-        else:
+#======================================================================================================#
+def search_symbols(symbols, choice=None):
+    """
+    Let the user search currencies or view all.
+
+    Args:
+        symbols (dict): Dictionary of all currency codes and names.
+        choice (str | None): "search" or "all" if already asked, otherwise the user is prompted.
+
+    Returns:
+        dict: A filtered dictionary of matches or the full symbols dict.
+    """
+    # state: "ask" (search/all prompt), "search", "no_match" (retry/all prompt) or "all"
+    state = choice or "ask"
+    lowered = None  # (code, name, "code name" lowercased) rows, built once and reused on retries
+    while state != "all":
+        if state == "ask":
+            state = ask_search_or_all()
+        elif state == "search":
+            if lowered is None:
+                lowered = [(c, n, f"{c} {n}".lower()) for c, n in symbols.items()]
+            # Every word of the query must appear in the code or name (e.g. "us dollar")
+            keywords = input("Enter part of currency name/code to search: ").lower().split()
+            matches = {c: n for c, n, text in lowered if all(k in text for k in keywords)}
+            if matches:
+                print_symbols(matches, "🔎 Matching Currencies:")
+                return matches
             print("❌ No matches found.")
+            state = "no_match"
+        else:
             # Offer retry or full list
-            while True:
-                nxt = input("Type 'retry' to search again, or 'all' to view all currencies: ").strip().lower()
-                if nxt == "retry":
-                    return search_symbols(symbols)   # recursion: try again
-                if nxt == "all":
-                    break
+            nxt = input("Type 'retry' to search again, or 'all' to view all currencies: ").strip().lower()
+            if nxt == "retry":
+                state = "ask"
+            elif nxt == "all":
+                state = "all"
+            else:
                 print("❌ Invalid. Type 'retry' or 'all'.")
 
     # If choice is "all" or user chose 'all' after no matches
-    print("\nAvailable Currencies:\n" + "-" * 40)
-    for code, name in symbols.items():
-        print(f"{code} : {name}")
+    print_symbols(symbols, "Available Currencies:")
     return symbols
 
+#======================================================================================================#
+def allowed_codes(displayed_dict):
+    """
+    Return the set of currency codes in a dictionary, built once per dictionary.
+
+    Args:
+        displayed_dict (dict): Dictionary of currency codes and names.
+
+    Returns:
+        frozenset: The currency codes of displayed_dict.
+    """
+    entry = _ALLOWED_CACHE.get(id(displayed_dict))
+    if entry is None:
+        if len(_ALLOWED_CACHE) >= _ALLOWED_CACHE_MAX:
+            _ALLOWED_CACHE.clear()
+        entry = _ALLOWED_CACHE[id(displayed_dict)] = (displayed_dict, frozenset(displayed_dict))
+    return entry[1]
+
 #======================================================================================================#
 def choose_currency_from(displayed_dict, prompt):
     """
@@ -131,13 +425,65 @@ def choose_currency_from(displayed_dict, prompt):
     Returns:
         str: The chosen valid currency code.
     """
-    allowed = set(displayed_dict.keys())  # using set for faster lookup
+    allowed = allowed_codes(displayed_dict)
+    if readline is None:
+        return read_currency_code(prompt, allowed)
+
+    codes = sorted(allowed)
+
+    def complete(text, state):
+        matches = [c for c in codes if c.startswith(text.upper())]
+        return matches[state] if state < len(matches) else None
+
+    previous = readline.get_completer()
+    readline.set_completer(complete)  # Tab completes codes from the allowed set
+    try:
+        return read_currency_code(prompt, allowed)
+    finally:
+        readline.set_completer(previous)
+
+#======================================================================================================#
+def read_currency_code(prompt, allowed):
+    """
+    Prompt until the user enters one of the allowed currency codes.
+
+    Args:
+        prompt (str): Prompt message asking for input.
+        allowed (frozenset): The valid currency codes.
+
+    Returns:
+        str: The chosen valid currency code.
+    """
     while True:
         cur = input(prompt).strip().upper()
         if cur in allowed:
             return cur
         print("❌ Invalid currency code. Please choose from the list shown.")
 
+#======================================================================================================#
+def select_currency(symbols, prompt, choice=None):
+    """
+    Let the user search/list currencies, then choose one code.
+
+    Args:
+        symbols (dict): Dictionary of all currency codes and names.
+        prompt (str): Prompt message asking for the currency code.
+        choice (str | None): "search" or "all" if already asked, otherwise the user is prompted.
+
+    Returns:
+        str: The chosen valid currency code.
+    """
+    displayed = search_symbols(symbols, choice)
+    if displayed is symbols:
+        return choose_currency_from(symbols, prompt)
+
+    use_displayed = input("Pick from the displayed results only? (y/n): ").strip().lower()
+    if use_displayed == "y":
+        return choose_currency_from(displayed, prompt)
+
+    print_symbols(symbols, "Showing all currencies now:", width=30)
+    return choose_currency_from(symbols, prompt)
+
 #======================================================================================================#
 def get_amount():
     """
@@ -158,36 +504,75 @@ def get_amount():
         return amount
 
 #======================================================================================================#
-def convert_currency(from_currency, to_currency, amount):
+def get_rate(from_currency, to_currency, report=print):
     """
-    Perform currency conversion using the API.
+    Get the exchange rate between two currencies, cached for RATE_TTL seconds.
 
     Args:
         from_currency (str): Source currency code (e.g., "USD").
         to_currency (str): Target currency code (e.g., "EUR").
-        amount (float): Amount to convert.
+        report (callable): Used instead of print() to output messages.
 
     Returns:
-        float | None: The converted amount, or None if failed.
+        float | None: How many units of to_currency one from_currency buys, or None if failed.
     """
-    url = f"{BASE_URL}/convert?to={to_currency}&from={from_currency}&amount={amount}"
-    headers = {"apikey": API_KEY}
+    cached = _RATE_CACHE.get((from_currency, to_currency))
+    if cached and time.monotonic() - cached[1] < RATE_TTL:
+        return cached[0]
+
+    params = {"to": to_currency, "from": from_currency, "amount": RATE_AMOUNT}
+    _CONNECTION["used"] = True
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(CONVERT_URL, params=params, timeout=REQUEST_TIMEOUT)
+    except requests.exceptions.Timeout:
+        report(TIMEOUT_MESSAGE)
+        return None
     except requests.exceptions.RequestException as e:
-        print("❌ Network error while converting:", e)
+        report("❌ Network error while converting:", e)
         return None
 
     if response.status_code != 200:
-        handle_error(response)
+        handle_error(response, report)
         return None
 
-    data = response.json()
-    if not data.get("success", True):
-        print("❌ API Error:", data.get("error", data))
+    data = json_loads(response.content)
+    if not data.get("success"):
+        api_error(data, report)
         return None
 
-    return data.get("result")
+    result = data.get("result")
+    if not result:
+        return None
+    rate = result / RATE_AMOUNT
+    _RATE_CACHE[(from_currency, to_currency)] = (rate, time.monotonic())
+    return rate
+
+#======================================================================================================#
+def convert_currency(from_currency, to_currency, amount, symbols):
+    """
+    Convert an amount between two currencies using the (cached) API rate.
+
+    Codes are validated against the known symbols first, so bad input
+    never costs a network round-trip.
+
+    Args:
+        from_currency (str): Source currency code (e.g., "USD").
+        to_currency (str): Target currency code (e.g., "EUR").
+        amount (float): Amount to convert.
+        symbols (dict): Dictionary of all valid currency codes and names.
+
+    Returns:
+        float | None: The converted amount, or None if failed.
+    """
+    for code in (from_currency, to_currency):
+        if code not in symbols:
+            print("❌ Unknown currency code:", code)
+            return None
+    if from_currency == to_currency:
+        return amount
+
+    rate = get_rate(from_currency, to_currency)
+    return amount * rate if rate else None
 
 #======================================================================================================#
 #==================================== Main program flow================================================#
@@ -195,52 +580,37 @@ def convert_currency(from_currency, to_currency, amount):
 def main():
     """
     Main program flow:
-    - Fetch symbols
+    - Fetch symbols in the background while the user picks search/all
     - Display/search currencies
     - Prompt user to select from-currency and to-currency
-    - Ask for amount
+    - Ask for amount while the rate is fetched in the background
     - Convert and display result
     """
-    symbols = get_symbols()
-    if not symbols:
-        return
+    symbols_future = run_in_background(load_symbols)
 
     print("\n=== Currency Converter ===")
-    # Step 1: Search or view all currencies
-    displayed = search_symbols(symbols)
+    # Step 1: Ask search or view all while symbols load
+    choice = ask_search_or_all()
+    symbols = background_result(symbols_future)
+    if not symbols:
+        return
 
     # Step 2: Choose FROM currency
-    if displayed is not symbols:
-        use_displayed = input("Pick from the displayed results only? (y/n): ").strip().lower()
-        if use_displayed == "y":
-            from_currency = choose_currency_from(displayed, "\nEnter the currency you want to convert from (e.g. USD): ")
-        else:
-            print("\nShowing all currencies now:\n" + "-" * 30)
-            for code, name in symbols.items():
-                print(f"{code} : {name}")
-            from_currency = choose_currency_from(symbols, "\nEnter the currency you want to convert from (e.g. USD): ")
-    else:
-        from_currency = choose_currency_from(symbols, "\nEnter the currency you want to convert from (e.g. USD): ")
+    from_currency = select_currency(symbols, "\nEnter the currency you want to convert from (e.g. USD): ", choice)
 
     # Step 3: Choose TO currency (search again if needed)
     print("\nYou selected:", from_currency)
     print("\nNow choose the currency to convert TO.")
-    displayed2 = search_symbols(symbols)
-    if displayed2 is not symbols:
-        use_displayed2 = input("Pick from the displayed results only? (y/n): ").strip().lower()
-        if use_displayed2 == "y":
-            to_currency = choose_currency_from(displayed2, "Enter the currency you want to convert to (e.g. EGP): ")
-        else:
-            print("\nShowing all currencies now:\n" + "-" * 30)
-            for code, name in symbols.items():
-                print(f"{code} : {name}")
-            to_currency = choose_currency_from(symbols, "Enter the currency you want to convert to (e.g. EGP): ")
-    else:
-        to_currency = choose_currency_from(symbols, "Enter the currency you want to convert to (e.g. EGP): ")
+    to_currency = select_currency(symbols, "Enter the currency you want to convert to (e.g. EGP): ")
 
-    # Step 4: Amount and conversion
+    # Step 4: Amount and conversion (the rate is fetched while the user types the amount)
+    rate_future = None
+    if from_currency != to_currency:
+        rate_future = run_in_background(get_rate, from_currency, to_currency)
     amount = get_amount()
-    result = convert_currency(from_currency, to_currency, amount)
+    if rate_future and background_result(rate_future) is None:
+        return
+    result = convert_currency(from_currency, to_currency, amount, symbols)
     if result is not None:
         print(f"\n✅ {amount:,.2f} {from_currency} = {result:,.2f} {to_currency}")
 